@@ -35,6 +35,73 @@ from typing import List, Tuple, Dict
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
+# Numba is optional - it compiles the single-pose FK chain to native code
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def _fk_chain(theta, M, T):
+    """
+    Chain Rot_z(theta_i) * M_i for every joint into T (4x4, written in place)
+    
+    Plain scalar loops so numba can compile it; only used when numba is installed.
+    Every DH matrix is affine (last row [0, 0, 0, 1]), so only the top 3x4
+    block is ever multiplied. Each row of T only depends on its own old
+    values, so rows are updated in place with no scratch arrays.
+    """
+    T[:, :] = 0.0
+    for r in range(4):
+        T[r, r] = 1.0
+    
+    for i in range(theta.shape[0]):
+        ct = np.cos(theta[i])
+        st = np.sin(theta[i])
+        
+        # [R p] * [Ri pi] = [R*Ri  R*pi + p]
+        for r in range(3):
+            t0 = T[r, 0]
+            t1 = T[r, 1]
+            t2 = T[r, 2]
+            for c in range(4):
+                m0 = M[i, 0, c]
+                m1 = M[i, 1, c]
+                acc = t0 * (ct * m0 - st * m1) + t1 * (st * m0 + ct * m1) + t2 * M[i, 2, c]
+                if c == 3:
+                    acc += T[r, 3]
+                T[r, c] = acc
+
+
+def _fk_position(theta, M, p):
+    """
+    End-effector position only, written into p (3,)
+    
+    Carries a point from the tip back to the base through each joint
+    (p <- Rot_z(theta_i) * M_i * p), so no rotation matrices are chained.
+    """
+    x = 0.0
+    y = 0.0
+    z = 0.0
+    for i in range(theta.shape[0] - 1, -1, -1):
+        ct = np.cos(theta[i])
+        st = np.sin(theta[i])
+        mx = M[i, 0, 0] * x + M[i, 0, 1] * y + M[i, 0, 2] * z + M[i, 0, 3]
+        my = M[i, 1, 0] * x + M[i, 1, 1] * y + M[i, 1, 2] * z + M[i, 1, 3]
+        mz = M[i, 2, 0] * x + M[i, 2, 1] * y + M[i, 2, 2] * z + M[i, 2, 3]
+        x = ct * mx - st * my
+        y = st * mx + ct * my
+        z = mz
+    p[0] = x
+    p[1] = y
+    p[2] = z
+
+
+if HAVE_NUMBA:
+    _fk_chain = njit(cache=True)(_fk_chain)
+    _fk_position = njit(cache=True)(_fk_position)
+
 class RobotKinematics:
     """Forward and Inverse Kinematics with calibratable DH parameters"""
     
@@ -69,6 +136,54 @@ class RobotKinematics:
         else:
             self.dh_params = np.array(dh_params)
     
+    @property
+    def dh_params(self):
+        """(6, 4) array of [a, alpha, d, theta_offset] per joint"""
+        return self._dh_params
+    
+    @dh_params.setter
+    def dh_params(self, value):
+        # Assign a new array to change the parameters; the stored copy is
+        # read-only so an in-place edit raises instead of leaving the cached
+        # link transforms stale
+        self._dh_params = np.array(value, dtype=float)
+        self._dh_params.setflags(write=False)
+        self._update_link_transforms()
+    
+    def _update_link_transforms(self):
+        """
+        Precompute the constant part of every joint's DH matrix
+        
+        Only the joint angle changes at runtime, so each joint's matrix
+        factors into Rot_z(theta) * M_i with
+        M_i = Rot_z(theta_offset) * Trans_z(d) * Trans_x(a) * Rot_x(alpha)
+        fixed until the parameters change. Folding the offset in here means
+        the FK never adds it (or evaluates its trig) per call.
+        """
+        a, alpha, d, theta_offset = self._dh_params.T
+        ca = np.cos(alpha)
+        sa = np.sin(alpha)
+        co = np.cos(theta_offset)[:, None]
+        so = np.sin(theta_offset)[:, None]
+        
+        # Trans_z(d) * Trans_x(a) * Rot_x(alpha)
+        M = np.zeros((len(self._dh_params), 4, 4))
+        M[:, 0, 0] = 1.0
+        M[:, 0, 3] = a
+        M[:, 1, 1] = ca
+        M[:, 1, 2] = -sa
+        M[:, 2, 1] = sa
+        M[:, 2, 2] = ca
+        M[:, 2, 3] = d
+        M[:, 3, 3] = 1.0
+        
+        # Rot_z(theta_offset) only mixes the first two rows
+        row0 = M[:, 0].copy()
+        row1 = M[:, 1].copy()
+        M[:, 0] = co * row0 - so * row1
+        M[:, 1] = so * row0 + co * row1
+        self._link_transforms = M
+    
     def dh_transform(self, a, alpha, d, theta):
         """
         Create transformation matrix from DH parameters
@@ -87,6 +202,25 @@ class RobotKinematics:
             [0,      0,      0,       1]
         ])
     
+    def _joint_transform(self, i, ct, st, out, rot):
+        """
+        DH matrix of joint i, built from its precomputed constant part
+        
+        Rot_z(theta) only mixes the first two rows of M_i, so this is two
+        row combinations instead of a full matrix build. Takes cos/sin of
+        theta so callers can evaluate the trig for all joints at once.
+        The matrix is written into the 4x4 `out`, with the 2x2 `rot` as
+        scratch, so the FK chain can reuse both for every joint.
+        """
+        M = self._link_transforms[i]
+        rot[0, 0] = ct
+        rot[0, 1] = -st
+        rot[1, 0] = st
+        rot[1, 1] = ct
+        np.matmul(rot, M[:2], out=out[:2])
+        out[2:] = M[2:]
+        return out
+    
     def forward_kinematics(self, joint_angles, use_all_joints=False):
         """
         Calculate end-effector position from joint angles
@@ -99,30 +233,106 @@ class RobotKinematics:
             position: [x, y, z] in mm
             transform: full 4x4 transformation matrix
         """
-        joint_angles = np.array(joint_angles)
-        
-        # Start with identity matrix
-        T = np.eye(4)
+        joint_angles = np.array(joint_angles, dtype=float)
         
         # Number of joints to use (4 for position, 6 for full orientation)
         n_joints = 6 if use_all_joints else 4
         
-        # Multiply transformations
+        theta = joint_angles[:n_joints]  # Offsets are folded into the link transforms
+        
+        if HAVE_NUMBA:
+            T = np.empty((4, 4))
+            _fk_chain(theta, self._link_transforms[:n_joints], T)
+            return T[0:3, 3], T
+        
+        # One vectorized cos/sin for all joints instead of two scalar calls each
+        ct = np.cos(theta).tolist()
+        st = np.sin(theta).tolist()
+        
+        # Start with identity matrix
+        T = np.eye(4)
+        tmp = np.empty((4, 4))
+        Ti = np.empty((4, 4))
+        rot = np.empty((2, 2))
+        
+        # Multiply transformations, ping-ponging between T and tmp
         for i in range(n_joints):
-            theta = joint_angles[i] + self.dh_params[i, 3]  # Add offset
-            Ti = self.dh_transform(
-                self.dh_params[i, 0],  # a
-                self.dh_params[i, 1],  # alpha
-                self.dh_params[i, 2],  # d
-                theta                   # theta
-            )
-            T = T @ Ti
+            np.matmul(T, self._joint_transform(i, ct[i], st[i], Ti, rot), out=tmp)
+            T, tmp = tmp, T
         
         # Extract position from transformation matrix
         position = T[0:3, 3]
         
         return position, T
     
+    def forward_kinematics_position(self, joint_angles, use_all_joints=False):
+        """
+        Calculate only the end-effector position from joint angles
+        
+        Faster than forward_kinematics() when the rotation isn't needed
+        (IK error terms, calibration checks).
+        
+        Args:
+            joint_angles: array of 6 joint angles in radians
+            use_all_joints: if True, use all 6 joints; else use first 4 (position only)
+            
+        Returns:
+            position: [x, y, z] in mm
+        """
+        n_joints = 6 if use_all_joints else 4
+        theta = np.array(joint_angles, dtype=float)[:n_joints]  # Offsets are folded into the link transforms
+        
+        position = np.empty(3)
+        if HAVE_NUMBA:
+            _fk_position(theta, self._link_transforms[:n_joints], position)
+            return position
+        
+        # Same tip-to-base recursion with the 3x4 blocks, one joint at a time
+        ct = np.cos(theta)
+        st = np.sin(theta)
+        p = np.zeros(3)
+        for i in range(n_joints - 1, -1, -1):
+            M = self._link_transforms[i]
+            q = M[:3, :3] @ p + M[:3, 3]
+            p = np.array([ct[i] * q[0] - st[i] * q[1], st[i] * q[0] + ct[i] * q[1], q[2]])
+        position[:] = p
+        return position
+    
+    def forward_kinematics_batch(self, joint_angles, use_all_joints=False):
+        """
+        Calculate end-effector positions for many joint configurations at once
+        
+        Args:
+            joint_angles: (N, 6) array of joint angles in radians
+            use_all_joints: if True, use all 6 joints; else use first 4 (position only)
+            
+        Returns:
+            positions: (N, 3) array of [x, y, z] in mm
+            transforms: (N, 4, 4) array of transformation matrices
+        """
+        n_joints = 6 if use_all_joints else 4
+        joint_angles = np.asarray(joint_angles, dtype=float)[:, :n_joints]
+        
+        # Joint-major (SoA) layout: one contiguous row of N angles per joint
+        theta = np.ascontiguousarray(joint_angles.T)  # Offsets are folded into the link transforms
+        ct = np.cos(theta)[..., None]
+        st = np.sin(theta)[..., None]
+        
+        # (n_joints, N, 4, 4) stack of DH matrices: Rot_z(theta) * M_i
+        M = self._link_transforms[:n_joints, None]
+        Ti = np.empty(theta.shape + (4, 4))
+        Ti[..., 0, :] = ct * M[..., 0, :] - st * M[..., 1, :]
+        Ti[..., 1, :] = st * M[..., 0, :] + ct * M[..., 1, :]
+        Ti[..., 2:, :] = M[..., 2:, :]
+        
+        # Chain the joints; each Ti[i] is a contiguous (N, 4, 4) block and
+        # matmul broadcasts over the N configurations
+        T = Ti[0]
+        for i in range(1, n_joints):
+            T = T @ Ti[i]
+        
+        return T[:, 0:3, 3], T
+    
     def inverse_kinematics(self, target_pos, current_angles=None, method='geometric'):
         """
         Calculate joint angles to reach target position
@@ -140,6 +350,30 @@ class RobotKinematics:
         else:
             return self._inverse_kinematics_numeric(target_pos, current_angles)
     
+    def is_reachable(self, targets):
+        """
+        Check which targets the geometric IK can reach
+        
+        Works on a single [x, y, z] or an (N, 3) array, so a whole workspace
+        grid can be checked in one pass. Compares squared distances, no sqrt.
+        
+        Args:
+            targets: [x, y, z] or (N, 3) array of positions in mm
+            
+        Returns:
+            bool, or (N,) bool array
+        """
+        targets = np.asarray(targets, dtype=float)
+        L1 = self.dh_params[0, 2]
+        L2 = self.dh_params[1, 0]
+        L3 = self.dh_params[2, 0]
+        L4 = self.dh_params[3, 0]
+        
+        # Same wrist point as _inverse_kinematics_geometric
+        wz = targets[..., 2] - L1 + L4
+        D2 = targets[..., 0]**2 + targets[..., 1]**2 + wz**2
+        return ((L2 - L3)**2 <= D2) & (D2 <= (L2 + L3)**2)
+    
     def _inverse_kinematics_geometric(self, target_pos):
         """
         Analytical inverse kinematics for 4-DOF positioning
@@ -173,16 +407,16 @@ class RobotKinematics:
         wx = r
         wz = h + L4  # Adjust for end-effector length
         
-        # Distance to wrist
-        D = np.sqrt(wx**2 + wz**2)
+        # Squared distance to wrist (only D**2 is needed below)
+        D2 = wx**2 + wz**2
         
         # Check if reachable
-        if D > (L2 + L3) or D < abs(L2 - L3):
-            print(f"Target unreachable! D={D:.1f}, L2+L3={L2+L3:.1f}")
+        if D2 > (L2 + L3)**2 or D2 < (L2 - L3)**2:
+            print(f"Target unreachable! D={np.sqrt(D2):.1f}, L2+L3={L2+L3:.1f}")
             return None
         
         # Law of cosines for elbow angle
-        cos_theta3 = (D**2 - L2**2 - L3**2) / (2 * L2 * L3)
+        cos_theta3 = (D2 - L2**2 - L3**2) / (2 * L2 * L3)
         cos_theta3 = np.clip(cos_theta3, -1, 1)  # Numerical safety
         theta3 = np.arccos(cos_theta3)  # Elbow up configuration
         
@@ -209,7 +443,7 @@ class RobotKinematics:
         
         def objective(angles):
             """Distance between FK result and target"""
-            pos, _ = self.forward_kinematics(angles[:6])
+            pos = self.forward_kinematics_position(angles[:6])
             error = np.linalg.norm(pos - target_pos)
             return error
         
@@ -258,12 +492,9 @@ class RobotCalibration:
             return None
         
         # Convert to radians (centered at 2048 = 0°)
-        joint_angles = []
-        for i, deg in enumerate(positions_deg):
-            # Assuming 2048 steps = 0°, convert to radians
-            steps = int(deg / 360 * 4096)
-            rad = (steps - 2048) * 2 * np.pi / 4096
-            joint_angles.append(rad)
+        # Assuming 2048 steps = 0°, truncate to whole steps like int() did
+        steps = np.trunc(np.asarray(positions_deg, dtype=float) / 360 * 4096)
+        joint_angles = ((steps - 2048) * (2 * np.pi / 4096)).tolist()
         
         print(f"Current joint angles (degrees): {positions_deg}")
         
@@ -282,7 +513,7 @@ class RobotCalibration:
             actual_position = np.array(manual_position)
         
         # Compare with FK prediction
-        predicted_pos, _ = self.kinematics.forward_kinematics(joint_angles)
+        predicted_pos = self.kinematics.forward_kinematics_position(joint_angles)
         error = np.linalg.norm(predicted_pos - actual_position)
         
         print(f"\nPredicted position: [{predicted_pos[0]:.1f}, {predicted_pos[1]:.1f}, {predicted_pos[2]:.1f}] mm")
@@ -321,21 +552,22 @@ class RobotCalibration:
         y_range = [-150, 150]
         z_range = [50, 300]
         
-        # Generate random target positions
+        # Generate random target positions (same draw order as x, y, z per point)
         np.random.seed(42)
-        targets = []
-        for i in range(n_points):
-            x = np.random.uniform(*x_range)
-            y = np.random.uniform(*y_range)
-            z = np.random.uniform(*z_range)
-            targets.append([x, y, z])
+        ranges = np.array([x_range, y_range, z_range])
+        targets = np.random.uniform(ranges[:, 0], ranges[:, 1], size=(n_points, 3))
+        reachable = self.kinematics.is_reachable(targets)
         
         collected = 0
-        for i, target in enumerate(targets):
+        for i, target in enumerate(targets.tolist()):
             print(f"\n{'='*60}")
             print(f"Point {i+1}/{n_points}: Moving to target {target}")
             print(f"{'='*60}")
             
+            if not reachable[i]:
+                print("✗ Target out of reach, skipping...")
+                continue
+            
             # Calculate IK
             joint_angles = self.kinematics.inverse_kinematics(target)
             if joint_angles is None:
@@ -362,11 +594,7 @@ class RobotCalibration:
     
     def _angles_to_degrees(self, angles_rad):
         """Convert joint angles (radians) to degrees"""
-        degrees = []
-        for rad in angles_rad:
-            deg = rad * 180.0 / np.pi
-            degrees.append(deg)
-        return degrees
+        return np.rad2deg(angles_rad).tolist()
     
     def optimize_parameters(self, params_to_optimize='all'):
         """
@@ -385,8 +613,8 @@ class RobotCalibration:
         print(f"Using {len(self.calibration_data)} calibration points")
         
         # Extract calibration data
-        joint_angles_list = [np.array(d['joint_angles']) for d in self.calibration_data]
-        actual_positions = [np.array(d['actual_position']) for d in self.calibration_data]
+        joint_angles_list = np.array([d['joint_angles'] for d in self.calibration_data])
+        actual_positions = np.array([d['actual_position'] for d in self.calibration_data])
         
         # Current parameters
         initial_params = self.kinematics.dh_params.flatten()
@@ -400,13 +628,9 @@ class RobotCalibration:
             dh_params = params_flat.reshape(6, 4)
             temp_kin = RobotKinematics(dh_params)
             
-            errors = []
-            for joints, actual_pos in zip(joint_angles_list, actual_positions):
-                pred_pos, _ = temp_kin.forward_kinematics(joints)
-                error = pred_pos - actual_pos
-                errors.extend(error)  # Flatten to 1D
-            
-            return np.array(errors)
+            # All calibration points in one batched FK call
+            pred_pos, _ = temp_kin.forward_kinematics_batch(joint_angles_list)
+            return (pred_pos - actual_positions).ravel()  # Flatten to 1D
         
         # Initial error
         initial_errors = residuals(initial_params)
@@ -504,7 +728,7 @@ class RobotCalibration:
                 
                 # Read actual position (would need external measurement)
                 # For now, just verify FK
-                actual_pos, _ = self.kinematics.forward_kinematics(joint_angles)
+                actual_pos = self.kinematics.forward_kinematics_position(joint_angles)
                 actual_positions.append(actual_pos)
                 
                 error = np.linalg.norm(actual_pos - target)
@@ -47,12 +47,14 @@ def plot_errors_3d(data):
     ax1.scatter(actual[:, 0], actual[:, 1], actual[:, 2],
                 c='red', marker='^', s=100, label='Actual', alpha=0.6)
     
-    # Draw error vectors
-    for i in range(len(points)):
-        ax1.plot([predicted[i, 0], actual[i, 0]],
-                [predicted[i, 1], actual[i, 1]],
-                [predicted[i, 2], actual[i, 2]],
-                'gray', linestyle='--', alpha=0.3)
+    # Draw error vectors as one line broken by NaN gaps
+    # (a single plot call instead of one per point)
+    segments = np.full((len(points), 3, 3), np.nan)
+    segments[:, 0] = predicted
+    segments[:, 1] = actual
+    segments = segments.reshape(-1, 3)
+    ax1.plot(segments[:, 0], segments[:, 1], segments[:, 2],
+            'gray', linestyle='--', alpha=0.3)
     
     ax1.set_xlabel('X (mm)')
     ax1.set_ylabel('Y (mm)')
@@ -7,24 +7,63 @@ Two robots on same bus:
 - Follower: Follows leader's movements in real-time
 """
 
+import gc
 import time
 import json
-from robot_controller import RobotController
-from servo_limits_config import degrees_to_steps, steps_to_degrees
+import numpy as np
+from robot_controller import (
+    RobotController, SMS_STS_RETURN_DELAY, SMS_STS_STATUS_RETURN_LEVEL, SMS_STS_TORQUE_ENABLE
+)
+from servo_limits_config import degrees_to_steps, steps_to_degrees, STEPS_PER_DEGREE, DEGREES_PER_STEP
 
 # Servo IDs for each robot
 # Current detected: 1, 3, 5, 7 (both robots have same IDs - need to change one!)
 LEADER_SERVO_IDS = [1, 2, 3, 4, 5, 6]       # Leader robot servo IDs (6 joints, no gripper)
 FOLLOWER_SERVO_IDS = [8, 9, 10, 11, 12, 13, 14]  # Follower robot servo IDs (7 joints with gripper)
 
+# Follower servos whose target moved less than this (in steps) are not rewritten
+WRITE_DEADBAND_STEPS = 2
+
+
+def degrees_to_steps_array(degrees):
+    """Vectorized degrees_to_steps for a whole list of joint angles"""
+    normalized = np.mod(np.asarray(degrees, dtype=float), 360.0)
+    steps = np.rint(normalized * STEPS_PER_DEGREE).astype(int)
+    return np.minimum(steps, 4095)
+
+
+def steps_to_degrees_array(steps):
+    """Vectorized steps_to_degrees for a whole list of servo positions"""
+    angles = np.asarray(steps, dtype=float) * DEGREES_PER_STEP
+    return np.where(angles > 180.0, angles - 360.0, angles)
+
+
+def wait_until(deadline):
+    """Sleep until just before a perf_counter deadline, then spin to hit it"""
+    remaining = deadline - time.perf_counter() - 0.001
+    if remaining > 0:
+        time.sleep(remaining)
+    while time.perf_counter() < deadline:
+        pass
+
+
 class LeaderFollowerController:
-    def __init__(self):
+    def __init__(self, reply_to_reads_only=False):
         self.robot = RobotController()
         self.leader_positions = [0] * 6  # Leader has 6 joints (no gripper)
         self.follower_positions = [0] * 7  # Follower has 7 joints (with gripper)
         self.running = False
         self.gripper_position = 0.0  # Fixed gripper position for follower
         
+        # Last follower targets sent (steps), to skip unchanged writes
+        self._last_written_steps = None
+        self._last_written_speed = None
+        
+        # Opt-in: servos only reply to reads/pings while connected, the
+        # original Status Return Level is restored by disconnect()
+        self.reply_to_reads_only = reply_to_reads_only
+        self._saved_return_levels = {}
+        
         # Load home positions
         self.load_home_positions()
     
@@ -67,14 +106,38 @@ class LeaderFollowerController:
         
         # Scan for all servos on bus (IDs 1-20)
         print("\nScanning all servos on bus (IDs 1-20)...")
-        online_servos = []
-        for servo_id in range(1, 21):
-            if self.robot.ping(servo_id):
-                online_servos.append(servo_id)
-                print(f"  ✓ Servo {servo_id} online")
+        online_servos = self.robot.scan(range(1, 21))
+        for servo_id in online_servos:
+            print(f"  ✓ Servo {servo_id} online")
         
         print(f"\n✓ Found {len(online_servos)} total servos: {online_servos}")
         
+        # Servos reply after Return Delay Time (default 250-500 µs), which is
+        # pure idle bus time on every read - make them reply immediately.
+        # Only servos not already at 0 are written, to spare the EEPROM.
+        changed = [servo_id for servo_id in online_servos
+                   if self.robot.read_register(servo_id, SMS_STS_RETURN_DELAY) != 0]
+        for servo_id in changed:
+            self.robot.write_eeprom(servo_id, SMS_STS_RETURN_DELAY, 0)
+        if changed:
+            # Drop the status replies to the EEPROM writes
+            time.sleep(0.01)
+            self.robot.ser.reset_input_buffer()
+            print(f"✓ Return delay set to 0 on servos {changed}")
+        elif online_servos:
+            print("✓ Return delay already 0 on all online servos")
+        
+        if self.reply_to_reads_only and online_servos:
+            # Only reads/pings get a reply, so torque and goal writes don't hold
+            # the bus. This is stored in EEPROM and breaks the LeRobot tools,
+            # so remember each servo's level for disconnect() to put back.
+            self._saved_return_levels = {
+                servo_id: self.robot.read_register(servo_id, SMS_STS_STATUS_RETURN_LEVEL)
+                for servo_id in online_servos
+            }
+            responding = self.robot.set_reply_to_reads_only(online_servos)
+            print(f"✓ Write replies disabled on {len(responding)}/{len(online_servos)} servos")
+        
         if len(online_servos) < 14:
             print(f"\n⚠ Warning: Expected 14 servos (2 robots × 7), found {len(online_servos)}")
             print("\nDetected servo groups:")
@@ -117,17 +180,26 @@ class LeaderFollowerController:
         
         return True
     
+    def set_torque(self, servo_ids, enable):
+        """Enable/disable torque on several servos with one SYNC WRITE"""
+        value = 1 if enable else 0
+        self.robot.sync_write(servo_ids, SMS_STS_TORQUE_ENABLE, [[value]] * len(servo_ids))
+    
     def set_leader_torque(self, enable=False):
         """Enable/disable torque on leader robot"""
         print(f"\n{'Enabling' if enable else 'Disabling'} torque on leader robot...")
-        for servo_id in LEADER_SERVO_IDS:
-            # Write to torque enable register (address 0x28, value 0=off, 1=on)
-            self.robot.write_packet(servo_id, 0x03, [0x28, 1 if enable else 0])
-            time.sleep(0.01)
+        # Write to torque enable register (value 0=off, 1=on) on all leader servos at once
+        self.set_torque(LEADER_SERVO_IDS, enable)
         print(f"✓ Leader torque {'enabled' if enable else 'disabled'}")
     
     def read_leader_positions(self):
         """Read current positions from leader robot"""
+        # Single SYNC READ for all leader servos
+        steps = self.robot.sync_read_positions(LEADER_SERVO_IDS)
+        if steps is not None:
+            return steps_to_degrees_array(steps).tolist()
+        
+        # Fall back to reading one servo at a time
         positions = []
         for servo_id in LEADER_SERVO_IDS:
             pos_steps = self.robot.read_position(servo_id)
@@ -139,11 +211,37 @@ class LeaderFollowerController:
         return positions
     
     def write_follower_positions(self, positions, speed=1500):
-        """Write positions to follower robot"""
-        for i, servo_id in enumerate(FOLLOWER_SERVO_IDS):
-            if i < len(positions):
-                steps = degrees_to_steps(positions[i])
-                self.robot.write_position(servo_id, steps, speed=speed, acc=50)
+        """
+        Write positions to follower robot (single SYNC WRITE packet)
+        
+        Only servos whose target moved by more than WRITE_DEADBAND_STEPS
+        since the last write are included; nothing is sent while the
+        leader is stationary.
+        """
+        servo_ids = FOLLOWER_SERVO_IDS[:len(positions)]
+        steps = degrees_to_steps_array(positions[:len(servo_ids)])
+        
+        last = self._last_written_steps
+        if last is None or len(last) != len(steps) or speed != self._last_written_speed:
+            changed = np.ones(len(steps), dtype=bool)
+        else:
+            # Shortest distance around the 0/4095 wrap
+            delta = np.abs(steps - last)
+            delta = np.minimum(delta, 4096 - delta)
+            changed = delta > WRITE_DEADBAND_STEPS
+        
+        if not changed.any():
+            return
+        
+        ids = [servo_id for servo_id, c in zip(servo_ids, changed) if c]
+        self.robot.sync_write_positions(ids, steps[changed].tolist(), speed=speed, acc=50)
+        
+        if last is None or len(last) != len(steps):
+            last = steps.copy()
+        else:
+            last[changed] = steps[changed]
+        self._last_written_steps = last
+        self._last_written_speed = speed
     
     def move_to_home(self):
         """Move both robots to their home positions"""
@@ -151,9 +249,7 @@ class LeaderFollowerController:
         
         # Enable torque on both
         print("Enabling torque on both robots...")
-        for servo_id in LEADER_SERVO_IDS + FOLLOWER_SERVO_IDS:
-            self.robot.write_packet(servo_id, 0x03, [0x28, 1])
-            time.sleep(0.01)
+        self.set_torque(LEADER_SERVO_IDS + FOLLOWER_SERVO_IDS, True)
         
         time.sleep(0.5)
         
@@ -192,22 +288,26 @@ class LeaderFollowerController:
         
         # Enable torque on follower
         print("Enabling torque on follower robot...")
-        for servo_id in FOLLOWER_SERVO_IDS:
-            self.robot.write_packet(servo_id, 0x03, [0x28, 1])
-            time.sleep(0.01)
+        self.set_torque(FOLLOWER_SERVO_IDS, True)
         
         time.sleep(0.5)
         
         self.running = True
         update_interval = 1.0 / update_rate
         
+        # Follower may have moved since the last session, resend everything
+        self._last_written_steps = None
+        
         print(f"✅ Leader-follower active (updating at {update_rate}Hz)\n")
         
+        # Keep GC pauses out of the control loop
+        gc.disable()
+        
         try:
             loop_count = 0
+            read_failed = False
+            deadline = time.perf_counter()
             while self.running:
-                start_time = time.time()
-                
                 # Read leader positions
                 leader_pos = self.read_leader_positions()
                 
@@ -220,18 +320,27 @@ class LeaderFollowerController:
                         print(f"\rLeader: {[f'{p:6.1f}°' for p in leader_pos[:3]]}... → Follower", end='', flush=True)
                     
                     loop_count += 1
-                else:
+                    read_failed = False
+                elif not read_failed:
+                    # Report once per failure streak rather than flushing every cycle
                     print("\r⚠ Failed to read leader positions", end='', flush=True)
+                    read_failed = True
                 
-                # Maintain update rate
-                elapsed = time.time() - start_time
-                if elapsed < update_interval:
-                    time.sleep(update_interval - elapsed)
+                # Maintain update rate (fixed deadlines, no drift)
+                deadline += update_interval
+                now = time.perf_counter()
+                if deadline < now:
+                    # Overran a whole cycle, restart the schedule from now
+                    deadline = now
+                else:
+                    wait_until(deadline)
         
         except KeyboardInterrupt:
             print("\n\n🛑 Stopped by user")
         
         finally:
+            gc.enable()
+            
             # Re-enable torque on leader for safety
             print("\nRe-enabling torque on leader...")
             self.set_leader_torque(enable=True)
@@ -274,10 +383,24 @@ class LeaderFollowerController:
         else:
             print("❌ Failed to read positions")
     
+    def restore_status_return_level(self):
+        """Put back the Status Return Level changed by connect()"""
+        saved = self._saved_return_levels
+        if not saved:
+            return
+        # Servos whose level couldn't be read go back to the factory default
+        for level in set(lvl if lvl is not None else 1 for lvl in saved.values()):
+            servo_ids = [servo_id for servo_id, lvl in saved.items()
+                         if (lvl if lvl is not None else 1) == level]
+            self.robot.set_status_return_level(servo_ids, level)
+        self._saved_return_levels = {}
+        print("✓ Write replies restored")
+    
     def disconnect(self):
         """Disconnect and cleanup"""
         self.running = False
         if self.robot:
+            self.restore_status_return_level()
             self.robot.disconnect()
 
 
@@ -292,8 +415,19 @@ def main():
 ╚════════════════════════════════════════════════════════════════════╝
 """)
     
-    controller = LeaderFollowerController()
+    # Persisted in EEPROM until disconnect() restores it, so off unless asked
+    response = input("Disable servo write replies for faster control? Restored on exit (y/N): ")
+    controller = LeaderFollowerController(reply_to_reads_only=response.strip().lower() == 'y')
     
+    try:
+        run_menu(controller)
+    finally:
+        controller.disconnect()
+        print("\n✅ Disconnected")
+
+
+def run_menu(controller):
+    """Connect and run the interactive options menu"""
     if not controller.connect():
         return
     
@@ -336,10 +470,7 @@ def main():
             if response == 'yes':
                 # Scan current IDs
                 print("\nScanning current servo IDs...")
-                current_ids = []
-                for test_id in range(1, 15):
-                    if controller.robot.ping(test_id):
-                        current_ids.append(test_id)
+                current_ids = controller.robot.scan(range(1, 15))
                 
                 print(f"Found servos: {current_ids}")
                 
@@ -384,9 +515,6 @@ def main():
         
         else:
             print("Invalid option")
-    
-    controller.disconnect()
-    print("\n✅ Disconnected")
 
 
 if __name__ == "__main__":
@@ -14,6 +14,85 @@ import time
 import json
 
 
+def plan_trajectory(kinematics, targets):
+    """
+    Solve IK (and the FK check) for every target before the robot moves
+    
+    Args:
+        kinematics: RobotKinematics instance (calibrated)
+        targets: (N, 3) array of target positions in mm
+    
+    Returns:
+        List with one entry per target: (degrees, actual_pos, error),
+        or None where IK failed
+    """
+    targets = np.asarray(targets)
+    plan = [None] * len(targets)
+    
+    # Calculate IK
+    solutions = [kinematics.inverse_kinematics(target) for target in targets]
+    solved = [i for i, joint_angles in enumerate(solutions) if joint_angles is not None]
+    if not solved:
+        return plan
+    joint_angles = np.array([solutions[i] for i in solved])
+    
+    # Verify FK for all solutions in one batched call (where will robot actually go?)
+    actual_positions, _ = kinematics.forward_kinematics_batch(joint_angles)
+    errors = np.linalg.norm(actual_positions - targets[solved], axis=1)
+    
+    # Convert to degrees
+    degrees = np.rad2deg(joint_angles)
+    
+    for k, i in enumerate(solved):
+        plan[i] = (degrees[k].tolist(), actual_positions[k], errors[k])
+    return plan
+
+
+def _stream_trajectory(robot, kinematics, targets, speed, print_every=5):
+    """
+    Plan a whole trajectory up front, then move through it point by point
+    
+    Args:
+        robot: RobotController instance
+        kinematics: RobotKinematics instance (calibrated)
+        targets: (N, 3) array of target positions in mm
+        speed: movement speed
+        print_every: print progress every this many points
+    
+    Returns:
+        (actual_points, errors) for the points that were reached
+    """
+    n_points = len(targets)
+    
+    # Solve IK for every point up front so nothing is computed between moves
+    plan = plan_trajectory(kinematics, targets)
+    
+    actual_points = np.empty((n_points, 3))
+    errors = np.empty(n_points)
+    count = 0
+    
+    for i, (target, step) in enumerate(zip(targets, plan)):
+        x, y, z = target
+        if step is None:
+            print(f"✗ IK failed at point {i+1}/{n_points}: [{x:.1f}, {y:.1f}, {z:.1f}]")
+            continue
+        
+        degrees, actual_pos, error = step
+        
+        # Move robot
+        if robot.set_joint_positions_degrees(degrees[:7], speed=speed):
+            robot.wait_until_stopped()
+            actual_points[count] = actual_pos
+            errors[count] = error
+            count += 1
+            
+            if i % print_every == 0:
+                print(f"  Point {i+1}/{n_points}: target=[{x:.1f}, {y:.1f}, {z:.1f}], "
+                      f"error={error:.2f}mm")
+    
+    return actual_points[:count], errors[:count]
+
+
 def draw_circle(robot, kinematics, center, radius, n_points=36, speed=1000, z_safe=200):
     """
     Draw a circle to test calibration accuracy
@@ -33,39 +112,12 @@ def draw_circle(robot, kinematics, center, radius, n_points=36, speed=1000, z_sa
     
     # Generate circle points
     angles = np.linspace(0, 2*np.pi, n_points, endpoint=True)
+    targets = np.empty((n_points, 3))
+    targets[:, 0] = center[0] + radius * np.cos(angles)
+    targets[:, 1] = center[1] + radius * np.sin(angles)
+    targets[:, 2] = center[2]
     
-    actual_points = []
-    errors = []
-    
-    for i, angle in enumerate(angles):
-        # Calculate target point on circle
-        x = center[0] + radius * np.cos(angle)
-        y = center[1] + radius * np.sin(angle)
-        z = center[2]
-        target = np.array([x, y, z])
-        
-        # Calculate IK
-        joint_angles = kinematics.inverse_kinematics(target)
-        if joint_angles is None:
-            print(f"✗ IK failed at angle {angle*180/np.pi:.0f}°")
-            continue
-        
-        # Verify FK (where will robot actually go?)
-        actual_pos, _ = kinematics.forward_kinematics(joint_angles)
-        error = np.linalg.norm(actual_pos - target)
-        
-        # Convert to degrees and move
-        degrees = [rad * 180.0 / np.pi for rad in joint_angles]
-        
-        # Move robot
-        if robot.set_joint_positions_degrees(degrees[:7], speed=speed):
-            time.sleep(0.05)  # Small delay
-            actual_points.append(actual_pos)
-            errors.append(error)
-            
-            if i % 9 == 0:  # Print every 10th point
-                print(f"  Point {i+1}/{n_points}: target=[{x:.1f}, {y:.1f}, {z:.1f}], "
-                      f"error={error:.2f}mm")
+    actual_points, errors = _stream_trajectory(robot, kinematics, targets, speed, print_every=9)
     
     # Analyze circle quality
     if len(actual_points) > 0:
@@ -76,7 +128,8 @@ def draw_circle(robot, kinematics, center, radius, n_points=36, speed=1000, z_sa
 
 def analyze_circle(points, expected_center, expected_radius, errors):
     """Analyze how well the drawn circle matches expected"""
-    points = np.array(points)
+    points = np.asarray(points)
+    errors = np.asarray(errors)
     
     # Fit circle to points in XY plane
     center_xy = np.mean(points[:, :2], axis=0)
@@ -92,8 +145,8 @@ def analyze_circle(points, expected_center, expected_radius, errors):
     z_std = np.std(points[:, 2])
     
     # Position errors
-    mean_error = np.mean(errors)
-    max_error = np.max(errors)
+    mean_error = errors.mean()
+    max_error = errors.max()
     
     print("\n" + "="*70)
     print("CIRCLE QUALITY ANALYSIS")
@@ -144,34 +197,11 @@ def draw_line(robot, kinematics, start, end, n_points=20, speed=1000):
     print(f"Drawing Line: {start} → {end}")
     print("="*70)
     
-    actual_points = []
-    errors = []
-    
     # Generate line points
-    for i in range(n_points):
-        t = i / (n_points - 1)
-        target = np.array(start) * (1 - t) + np.array(end) * t
-        
-        # Calculate IK
-        joint_angles = kinematics.inverse_kinematics(target)
-        if joint_angles is None:
-            print(f"✗ IK failed at t={t:.2f}")
-            continue
-        
-        # Verify FK
-        actual_pos, _ = kinematics.forward_kinematics(joint_angles)
-        error = np.linalg.norm(actual_pos - target)
-        
-        # Convert to degrees and move
-        degrees = [rad * 180.0 / np.pi for rad in joint_angles]
-        
-        if robot.set_joint_positions_degrees(degrees[:7], speed=speed):
-            time.sleep(0.05)
-            actual_points.append(actual_pos)
-            errors.append(error)
-            
-            if i % 5 == 0:
-                print(f"  Point {i+1}/{n_points}: error={error:.2f}mm")
+    t = np.linspace(0, 1, n_points)
+    targets = np.array(start) * (1 - t)[:, None] + np.array(end) * t[:, None]
+    
+    actual_points, errors = _stream_trajectory(robot, kinematics, targets, speed, print_every=5)
     
     # Analyze line quality
     if len(actual_points) > 0:
@@ -182,7 +212,8 @@ def draw_line(robot, kinematics, start, end, n_points=20, speed=1000):
 
 def analyze_line(points, expected_start, expected_end, errors):
     """Analyze how straight the line is"""
-    points = np.array(points)
+    points = np.asarray(points)
+    errors = np.asarray(errors)
     expected_start = np.array(expected_start)
     expected_end = np.array(expected_end)
     
@@ -191,16 +222,10 @@ def analyze_line(points, expected_start, expected_end, errors):
     direction = direction / np.linalg.norm(direction)
     
     # Calculate perpendicular distance from ideal line
-    deviations = []
-    for point in points:
-        # Vector from start to point
-        v = point - expected_start
-        # Project onto line direction
-        projection_length = np.dot(v, direction)
-        projection = expected_start + projection_length * direction
-        # Perpendicular distance
-        deviation = np.linalg.norm(point - projection)
-        deviations.append(deviation)
+    # (project every point onto the line direction at once)
+    v = points - expected_start
+    projections = expected_start + (v @ direction)[:, None] * direction
+    deviations = np.linalg.norm(points - projections, axis=1)
     
     mean_deviation = np.mean(deviations)
     max_deviation = np.max(deviations)
@@ -224,8 +249,8 @@ def analyze_line(points, expected_start, expected_end, errors):
     print(f"  Error:           {abs(actual_length - expected_length):.2f} mm")
     
     print(f"\nPosition Accuracy:")
-    print(f"  Mean error:      {np.mean(errors):.2f} mm")
-    print(f"  Max error:       {np.max(errors):.2f} mm")
+    print(f"  Mean error:      {errors.mean():.2f} mm")
+    print(f"  Max error:       {errors.max():.2f} mm")
     
     # Overall grade
     if mean_deviation < 1 and abs(actual_length - expected_length) < 2:
@@ -261,17 +286,12 @@ def draw_square(robot, kinematics, center, side_length, speed=1000):
         [x - half, y - half, z],  # Back to start
     ]
     
-    all_points = []
+    # All four sides as one trajectory, planned in a single pass
+    targets = np.vstack([np.linspace(corners[i], corners[i+1], 15) for i in range(4)])
     
-    # Draw each side
-    for i in range(4):
-        print(f"\nDrawing side {i+1}/4...")
-        points, _ = draw_line(robot, kinematics, corners[i], corners[i+1], 
-                            n_points=15, speed=speed)
-        all_points.extend(points)
-        time.sleep(0.5)
+    actual_points, _ = _stream_trajectory(robot, kinematics, targets, speed, print_every=15)
     
-    return all_points
+    return actual_points
 
 
 def main():
@@ -33,6 +33,7 @@ Motor Configuration:
 """
 
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from lerobot.cameras import CameraConfig
 
@@ -43,6 +44,30 @@ except ImportError:
     from lerobot.common.robot_devices.robots.config import RobotConfig
 
 
+# Canonical motor ID maps, shared read-only by every config instance.
+# Each config gets its own plain-dict copy so it can still be overridden
+# and serialized like any other field.
+FOLLOWER_MOTOR_IDS = MappingProxyType({
+    "shoulder_pan": 1,
+    "shoulder_lift": 2,
+    "elbow_flex": 3,
+    "wrist_flex": 4,
+    "wrist_roll": 5,
+    "wrist_roll_2": 6,
+    "gripper": 7,  # Manually controlled with arrow keys
+})
+
+# Leader arm has 6 motors, no gripper
+LEADER_MOTOR_IDS = MappingProxyType({
+    "shoulder_pan": 1,
+    "shoulder_lift": 2,
+    "elbow_flex": 3,
+    "wrist_flex": 4,
+    "wrist_roll": 5,
+    "wrist_roll_2": 6,
+})
+
+
 @RobotConfig.register_subclass("kikobot_follower")
 @dataclass
 class KikobotFollowerConfig(RobotConfig):
@@ -61,6 +86,10 @@ class KikobotFollowerConfig(RobotConfig):
     # Prevents large sudden movements
     max_relative_target: float | dict[str, float] | None = 30.0  # degrees
     
+    # Maximum age (seconds) of the positions read by get_observation() that
+    # send_action() may reuse for clipping instead of reading the bus again
+    present_position_max_age_s: float = 0.02  # one 50Hz control period
+    
     # Camera configurations for observation
     cameras: dict[str, CameraConfig] = field(default_factory=dict)
     
@@ -68,15 +97,7 @@ class KikobotFollowerConfig(RobotConfig):
     use_degrees: bool = True
     
     # Motor IDs for follower arm
-    motor_ids: dict[str, int] = field(default_factory=lambda: {
-        "shoulder_pan": 1,
-        "shoulder_lift": 2,
-        "elbow_flex": 3,
-        "wrist_flex": 4,
-        "wrist_roll": 5,
-        "wrist_roll_2": 6,
-        "gripper": 7,  # Manually controlled with arrow keys
-    })
+    motor_ids: dict[str, int] = field(default_factory=FOLLOWER_MOTOR_IDS.copy)
     
     # Servo speed (steps/second) - ST3215 specific
     default_speed: int = 1500
@@ -128,14 +149,7 @@ class KikobotLeaderConfig(RobotConfig):
     use_degrees: bool = True
     
     # Motor IDs for leader arm (6 motors, no gripper)
-    motor_ids: dict[str, int] = field(default_factory=lambda: {
-        "shoulder_pan": 1,
-        "shoulder_lift": 2,
-        "elbow_flex": 3,
-        "wrist_flex": 4,
-        "wrist_roll": 5,
-        "wrist_roll_2": 6,
-    })
+    motor_ids: dict[str, int] = field(default_factory=LEADER_MOTOR_IDS.copy)
     
     # Read frequency for leader position updates
     read_frequency_hz: float = 50.0  # 50Hz = 20ms update rate
@@ -30,9 +30,12 @@ Hardware:
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import Any
 
+import numpy as np
+
 try:
     from lerobot.cameras.utils import make_cameras_from_configs
     from lerobot.motors import Motor, MotorCalibration, MotorNormMode
@@ -48,6 +51,9 @@ from .config_kikobot import KikobotFollowerConfig
 
 logger = logging.getLogger(__name__)
 
+# Goal_Position register of the STS3215 control table (2 bytes)
+GOAL_POSITION_ADDR = 42
+
 
 class KikobotFollower(Robot):
     """
@@ -109,17 +115,35 @@ class KikobotFollower(Robot):
             calibration=self.calibration,
         )
         
+        # Fixed motor order with matching IDs and action/observation keys
+        self._motor_names = tuple(self.bus.motors)
+        self._motor_ids = tuple(self.bus.motors[motor].id for motor in self._motor_names)
+        self._motor_keys = tuple(f"{motor}.pos" for motor in self._motor_names)
+        
         # Initialize gripper control separately (different servo model)
         self.gripper_id = config.motor_ids.get("gripper", 7)
         self.gripper_port = self.bus.port_handler  # Reuse same serial port
         
         # Initialize cameras if configured
         self.cameras = make_cameras_from_configs(config.cameras)
+        self._cam_pool = None  # Reads all cameras in parallel, created on connect
+        self._connected = False  # Set by connect()/disconnect()
+        
+        # Per-motor max_relative_target in bus motor order, for vectorized clipping
+        max_delta = config.max_relative_target
+        if isinstance(max_delta, dict):
+            self._max_delta = np.array([max_delta.get(motor, 30.0) for motor in self._motor_names])
+        elif max_delta is not None:
+            self._max_delta = np.full(len(self._motor_names), float(max_delta))
+        
+        # Last Present_Position read by get_observation(), reused by send_action()
+        self._last_present_pos = None
+        self._last_present_pos_ts = 0.0
 
-    @property
+    @cached_property
     def _motors_ft(self) -> dict[str, type]:
         """Feature types for motor positions"""
-        return {f"{motor}.pos": float for motor in self.bus.motors}
+        return dict.fromkeys(self._motor_keys, float)
 
     @property
     def _cameras_ft(self) -> dict[str, tuple]:
@@ -141,9 +165,23 @@ class KikobotFollower(Robot):
 
     @property
     def is_connected(self) -> bool:
-        """Check if robot and all cameras are connected"""
+        """Check if connect() has completed and disconnect() has not been called"""
+        return self._connected
+
+    def verify_connected(self) -> bool:
+        """Check if robot and all cameras are actually connected"""
         return self.bus.is_connected and all(cam.is_connected for cam in self.cameras.values())
 
+    def _raise_if_disconnected(self, error: Exception) -> None:
+        """
+        Re-check the devices after a bus or camera error.
+        
+        Raises:
+            DeviceNotConnectedError: If the bus or a camera has dropped out
+        """
+        if not self.verify_connected():
+            raise DeviceNotConnectedError(f"{self.name} lost connection: {error}") from error
+
     def connect(self, calibrate: bool = True) -> None:
         """
         Connect to the follower arm and configure it.
@@ -157,10 +195,11 @@ class KikobotFollower(Robot):
         if self.is_connected:
             raise DeviceAlreadyConnectedError(f"{self.name} already connected")
         
-        logger.info(f"Connecting to {self.name} on {self.config.port}...")
+        logger.info("Connecting to %s on %s...", self.name, self.config.port)
         
         # Connect to motor bus
         self.bus.connect()
+        self._set_low_latency()
         
         # Run calibration if needed
         if not self.is_calibrated and calibrate:
@@ -173,11 +212,29 @@ class KikobotFollower(Robot):
         # Connect cameras
         for cam in self.cameras.values():
             cam.connect()
+        if self.cameras:
+            self._cam_pool = ThreadPoolExecutor(
+                max_workers=len(self.cameras), thread_name_prefix=f"{self.name}_cam"
+            )
         
         # Configure motors with custom parameters
         self.configure()
         
-        logger.info(f"{self.name} connected successfully.")
+        self._connected = True
+        logger.info("%s connected successfully.", self.name)
+
+    def _set_low_latency(self) -> None:
+        """
+        Enable ASYNC_LOW_LATENCY on the bus serial port.
+        
+        USB-serial drivers otherwise hold received bytes for up to 16 ms,
+        which delays every status packet from the servos.
+        """
+        try:
+            self.bus.port_handler.ser.set_low_latency_mode(True)
+            logger.info("Low-latency mode enabled on %s", self.config.port)
+        except (AttributeError, NotImplementedError, OSError, ValueError) as e:
+            logger.warning("Could not enable low-latency mode on %s: %s", self.config.port, e)
 
     @property
     def is_calibrated(self) -> bool:
@@ -202,7 +259,7 @@ class KikobotFollower(Robot):
                 f"or type 'c' and press ENTER to run calibration: "
             )
             if user_input.strip().lower() != "c":
-                logger.info(f"Writing calibration file associated with the id {self.id} to the motors")
+                logger.info("Writing calibration file associated with the id %s to the motors", self.id)
                 # Filter calibration to only include motors that exist in the bus (no gripper for now)
                 filtered_calibration = {
                     motor: calib 
@@ -212,23 +269,22 @@ class KikobotFollower(Robot):
                 self.bus.write_calibration(filtered_calibration)
                 return
 
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Running calibration of {self.name}")
-        logger.info(f"{'='*60}")
+        logger.info("\n%s", "=" * 60)
+        logger.info("Running calibration of %s", self.name)
+        logger.info("%s", "=" * 60)
         
         # Disable torque for manual positioning
         self.bus.disable_torque()
         
         # Set all motors to position control mode
-        for motor in self.bus.motors:
-            self.bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
+        self.bus.sync_write("Operating_Mode", OperatingMode.POSITION.value)
         
         # Show current positions
         logger.info("\nReading current joint positions...")
         current_positions = self.bus.sync_read("Present_Position")
         logger.info("\nCurrent positions (raw steps):")
         for motor, pos in current_positions.items():
-            logger.info(f"  {motor:20s}: {pos:7.1f} steps")
+            logger.info("  %-20s: %7.1f steps", motor, pos)
         
         # Step 1: Set homing positions from current upright position
         input(
@@ -242,7 +298,7 @@ class KikobotFollower(Robot):
         # Step 2: Record range of motion for each joint
         # Note: wrist_roll can do full 360° rotation, others are limited
         full_turn_motor = "wrist_roll"
-        limited_range_motors = [motor for motor in self.bus.motors if motor != full_turn_motor]
+        limited_range_motors = [motor for motor in self._motor_names if motor != full_turn_motor]
         
         print(
             f"\n[STEP 2/2] Move all joints EXCEPT '{full_turn_motor}' sequentially through their\n"
@@ -259,9 +315,9 @@ class KikobotFollower(Robot):
 
         # Build calibration dictionary
         self.calibration = {}
-        for motor, m in self.bus.motors.items():
+        for motor, motor_id in zip(self._motor_names, self._motor_ids):
             self.calibration[motor] = MotorCalibration(
-                id=m.id,
+                id=motor_id,
                 drive_mode=0,
                 homing_offset=homing_offsets[motor],
                 range_min=range_mins[motor],
@@ -274,9 +330,9 @@ class KikobotFollower(Robot):
         # Save to file
         self._save_calibration()
         
-        logger.info(f"\n{'='*60}")
-        logger.info(f"✓ Calibration complete and saved to: {self.calibration_fpath}")
-        logger.info(f"{'='*60}\n")
+        logger.info("\n%s", "=" * 60)
+        logger.info("✓ Calibration complete and saved to: %s", self.calibration_fpath)
+        logger.info("%s\n", "=" * 60)
 
     def configure(self) -> None:
         """
@@ -289,39 +345,42 @@ class KikobotFollower(Robot):
         - Current protection
         - Overload protection
         """
-        logger.info(f"Configuring {self.name} motors...")
+        logger.info("Configuring %s motors...", self.name)
         
         with self.bus.torque_disabled():
             # Apply base motor configuration (with error handling)
             try:
                 self.bus.configure_motors()
             except Exception as e:
-                logger.warning(f"Error in configure_motors(), continuing: {e}")
+                logger.warning("Error in configure_motors(), continuing: %s", e)
             
-            # Configure each motor individually
-            for motor in self.bus.motors:
+            # Register values for regular joints (lower P to reduce shakiness)
+            joint_settings = {
+                "Operating_Mode": OperatingMode.POSITION.value,
+                "P_Coefficient": self.config.p_coefficient,
+                "I_Coefficient": self.config.i_coefficient,
+                "D_Coefficient": self.config.d_coefficient,
+                "Max_Torque_Limit": self.config.max_torque_limit,
+                "Protection_Current": self.config.protection_current,
+                "Overload_Torque": self.config.overload_torque,
+            }
+            # Gripper gets special limits to prevent burnout
+            gripper_settings = {
+                "Max_Torque_Limit": self.config.gripper_max_torque,
+                "Protection_Current": self.config.gripper_protection_current,
+                "Overload_Torque": self.config.gripper_overload_torque,
+            }
+            
+            # Write each register to all motors with a single sync write
+            for register, value in joint_settings.items():
+                values = {
+                    motor: gripper_settings.get(register, value) if motor == "gripper" else value
+                    for motor in self._motor_names
+                }
                 try:
-                    # Set position control mode
-                    self.bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
-                    
-                    # Set PID coefficients (lower P to reduce shakiness)
-                    self.bus.write("P_Coefficient", motor, self.config.p_coefficient)
-                    self.bus.write("I_Coefficient", motor, self.config.i_coefficient)
-                    self.bus.write("D_Coefficient", motor, self.config.d_coefficient)
-                    
-                    # Configure gripper with special limits to prevent burnout
-                    if motor == "gripper":
-                        self.bus.write("Max_Torque_Limit", motor, self.config.gripper_max_torque)
-                        self.bus.write("Protection_Current", motor, self.config.gripper_protection_current)
-                        self.bus.write("Overload_Torque", motor, self.config.gripper_overload_torque)
-                    else:
-                        # Regular joints use default limits
-                        self.bus.write("Max_Torque_Limit", motor, self.config.max_torque_limit)
-                        self.bus.write("Protection_Current", motor, self.config.protection_current)
-                        self.bus.write("Overload_Torque", motor, self.config.overload_torque)
+                    self.bus.sync_write(register, values)
                 except Exception as e:
-                    logger.warning(f"Error configuring motor '{motor}': {e}")
-                    continue
+                    logger.warning("Error configuring '%s': %s", register, e)
         
         logger.info("✓ Motor configuration complete")
 
@@ -332,9 +391,9 @@ class KikobotFollower(Robot):
         This should be run once when first setting up the robot to assign
         correct IDs to each motor. Connect motors one at a time as prompted.
         """
-        logger.info(f"\n{'='*60}")
+        logger.info("\n%s", "=" * 60)
         logger.info("Motor ID Setup for Kikobot Follower")
-        logger.info(f"{'='*60}\n")
+        logger.info("%s\n", "=" * 60)
         
         for motor in reversed(self.bus.motors):
             input(
@@ -342,11 +401,11 @@ class KikobotFollower(Robot):
                 f"(Disconnect all other motors first)"
             )
             self.bus.setup_motor(motor)
-            logger.info(f"✓ '{motor}' motor ID set to {self.bus.motors[motor].id}\n")
+            logger.info("✓ '%s' motor ID set to %s\n", motor, self.bus.motors[motor].id)
         
-        logger.info(f"{'='*60}")
+        logger.info("%s", "=" * 60)
         logger.info("✓ Motor ID setup complete!")
-        logger.info(f"{'='*60}\n")
+        logger.info("%s\n", "=" * 60)
 
     def get_observation(self) -> dict[str, Any]:
         """
@@ -363,21 +422,38 @@ class KikobotFollower(Robot):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self.name} is not connected.")
 
-        obs_dict = {}
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # Start camera captures first so they run while the serial bus is read
+        futures = {
+            cam_key: self._cam_pool.submit(cam.async_read)
+            for cam_key, cam in self.cameras.items()
+        }
         
         # Read arm position from all motors
         start = time.perf_counter()
-        positions = self.bus.sync_read("Present_Position")
-        obs_dict = {f"{motor}.pos": val for motor, val in positions.items()}
-        dt_ms = (time.perf_counter() - start) * 1000
-        logger.debug(f"{self.name} read state: {dt_ms:.1f}ms")
-
-        # Capture images from cameras
-        for cam_key, cam in self.cameras.items():
-            start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
+        try:
+            positions = self.bus.sync_read("Present_Position")
+        except Exception as e:
+            self._raise_if_disconnected(e)
+            raise
+        self._last_present_pos = positions
+        self._last_present_pos_ts = time.perf_counter()
+        obs_dict = {key: positions[motor] for motor, key in zip(self._motor_names, self._motor_keys)}
+        if debug:
+            dt_ms = (self._last_present_pos_ts - start) * 1000
+            logger.debug("%s read state: %.1fms", self.name, dt_ms)
+
+        # Collect camera images
+        try:
+            for cam_key, future in futures.items():
+                obs_dict[cam_key] = future.result()
+        except Exception as e:
+            self._raise_if_disconnected(e)
+            raise
+        if debug and futures:
             dt_ms = (time.perf_counter() - start) * 1000
-            logger.debug(f"{self.name} read {cam_key}: {dt_ms:.1f}ms")
+            logger.debug("%s read state + %d cameras: %.1fms", self.name, len(futures), dt_ms)
 
         return obs_dict
 
@@ -402,48 +478,54 @@ class KikobotFollower(Robot):
 
         # Extract motor positions from action dict (excluding gripper)
         try:
-            goal_pos = {motor: action[f"{motor}.pos"] for motor in self.bus.motors}
+            goal_pos = [action[key] for key in self._motor_keys]
         except KeyError as e:
-            logger.error(f"Missing motor in action dict: {e}")
-            logger.error(f"Expected motors: {list(self.bus.motors.keys())}")
-            logger.error(f"Received action keys: {list(action.keys())}")
+            logger.error("Missing motor in action dict: %s", e)
+            logger.error("Expected motors: %s", list(self._motor_names))
+            logger.error("Received action keys: %s", list(action.keys()))
             raise
         
         # Handle gripper separately if present in action
         gripper_pos = action.get("gripper.pos")
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # Apply safety checks and clipping if configured
         if self.config.max_relative_target is not None:
-            # Read current positions
-            present_pos = self.bus.sync_read("Present_Position")
+            # Reuse the positions from get_observation() if they are recent
+            # enough, otherwise read them from the bus
+            age = time.perf_counter() - self._last_present_pos_ts
+            if self._last_present_pos is not None and age < self.config.present_position_max_age_s:
+                present_pos = self._last_present_pos
+            else:
+                try:
+                    present_pos = self.bus.sync_read("Present_Position")
+                except Exception as e:
+                    self._raise_if_disconnected(e)
+                    raise
             
             # Clip goal positions to safe range (prevent large jumps)
-            max_delta = self.config.max_relative_target
-            for motor in goal_pos:
-                if motor in present_pos:
-                    current = present_pos[motor]
-                    target = goal_pos[motor]
-                    delta = target - current
-                    
-                    # Clip to max_relative_target
-                    if isinstance(max_delta, dict):
-                        motor_max_delta = max_delta.get(motor, 30.0)
-                    else:
-                        motor_max_delta = max_delta
-                    
-                    if abs(delta) > motor_max_delta:
-                        clipped_delta = max(-motor_max_delta, min(motor_max_delta, delta))
-                        goal_pos[motor] = current + clipped_delta
-                        logger.debug(
-                            f"Clipped {motor}: delta {delta:.1f}° → {clipped_delta:.1f}° "
-                            f"(max: {motor_max_delta:.1f}°)"
-                        )
+            current = np.array([present_pos[motor] for motor in self._motor_names], dtype=float)
+            delta = np.array(goal_pos, dtype=float) - current
+            clipped_delta = np.clip(delta, -self._max_delta, self._max_delta)
+            for idx in np.flatnonzero(clipped_delta != delta):
+                goal_pos[idx] = float(current[idx] + clipped_delta[idx])
+                if debug:
+                    logger.debug(
+                        "Clipped %s: delta %.1f° → %.1f° (max: %.1f°)",
+                        self._motor_names[idx], delta[idx], clipped_delta[idx], self._max_delta[idx],
+                    )
 
         # Send position commands to motors
-        start = time.perf_counter()
-        self.bus.sync_write("Goal_Position", goal_pos)
-        dt_ms = (time.perf_counter() - start) * 1000
-        logger.debug(f"{self.name} write goal position: {dt_ms:.1f}ms")
+        if debug:
+            start = time.perf_counter()
+        try:
+            self.bus.sync_write("Goal_Position", dict(zip(self._motor_names, goal_pos)))
+        except Exception as e:
+            self._raise_if_disconnected(e)
+            raise
+        if debug:
+            dt_ms = (time.perf_counter() - start) * 1000
+            logger.debug("%s write goal position: %.1fms", self.name, dt_ms)
         
         # Send gripper command if present
         if gripper_pos is not None:
@@ -452,19 +534,22 @@ class KikobotFollower(Robot):
                 gripper_steps = int((gripper_pos / 100.0) * 4095)
                 gripper_steps = max(0, min(4095, gripper_steps))
                 
-                # Write position using packet handler directly
-                self.bus.packet_handler.write4ByteTxRx(
+                # Write position using packet handler directly, without
+                # waiting for a status reply. The gripper shares the bus's
+                # port but is not in bus.motors, so the bus can't send it.
+                self.bus.packet_handler.write4ByteTxOnly(
                     self.gripper_port,
                     self.gripper_id,
-                    42,  # Goal_Position address for STS3215
+                    GOAL_POSITION_ADDR,
                     gripper_steps
                 )
-                logger.debug(f"Gripper set to {gripper_pos:.1f}% ({gripper_steps} steps)")
+                if debug:
+                    logger.debug("Gripper set to %.1f%% (%d steps)", gripper_pos, gripper_steps)
             except Exception as e:
-                logger.warning(f"Failed to control gripper: {e}")
+                logger.warning("Failed to control gripper: %s", e)
 
         # Return actual commanded action
-        commanded_action = {f"{motor}.pos": val for motor, val in goal_pos.items()}
+        commanded_action = dict(zip(self._motor_keys, goal_pos))
         if gripper_pos is not None:
             commanded_action["gripper.pos"] = gripper_pos
         return commanded_action
@@ -475,32 +560,39 @@ class KikobotFollower(Robot):
         
         Optionally disables torque based on configuration for safety.
         """
-        if not self.is_connected:
-            logger.warning(f"{self.name} is not connected.")
+        # The bus may be open after a connect() that failed part way
+        if not (self._connected or self.bus.is_connected):
+            logger.warning("%s is not connected.", self.name)
             return
+        self._connected = False
 
         # Disable torque if configured (allows manual positioning when off)
         if self.config.disable_torque_on_disconnect:
             try:
-                logger.info(f"Disabling torque on {self.name}...")
+                logger.info("Disabling torque on %s...", self.name)
                 self.bus.disable_torque()
             except Exception as e:
-                logger.warning(f"Could not disable torque on disconnect: {e}")
+                logger.warning("Could not disable torque on disconnect: %s", e)
 
+        self._last_present_pos = None
+        
         # Disconnect cameras
+        if self._cam_pool is not None:
+            self._cam_pool.shutdown(wait=True)
+            self._cam_pool = None
         for cam in self.cameras.values():
             try:
                 cam.disconnect()
             except Exception as e:
-                logger.warning(f"Error disconnecting camera: {e}")
+                logger.warning("Error disconnecting camera: %s", e)
 
         # Disconnect motor bus
         try:
             self.bus.disconnect()
         except Exception as e:
-            logger.warning(f"Error disconnecting motor bus: {e}")
+            logger.warning("Error disconnecting motor bus: %s", e)
         
-        logger.info(f"{self.name} disconnected.")
+        logger.info("%s disconnected.", self.name)
 
     def __repr__(self) -> str:
         return f"KikobotFollower(port={self.config.port}, motors={list(self.bus.motors.keys())})"
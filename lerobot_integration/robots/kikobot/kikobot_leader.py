@@ -31,9 +31,12 @@ Hardware:
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import Any
 
+import numpy as np
+
 try:
     from lerobot.cameras.utils import make_cameras_from_configs
     from lerobot.motors import Motor, MotorCalibration, MotorNormMode
@@ -113,14 +116,20 @@ class KikobotLeader(Robot):
         
         # Initialize cameras if configured (usually not needed for leader)
         self.cameras = make_cameras_from_configs(config.cameras)
+        self._cam_pool = None  # Reads all cameras in parallel, created on connect
+        
+        # Fixed motor order and matching observation keys
+        self._motor_names = tuple(self.bus.motors)
+        self._motor_keys = tuple(f"{motor}.pos" for motor in self._motor_names)
         
-        # Position smoothing state (exponential moving average)
+        # Position smoothing state (exponential moving average), one entry
+        # per motor in _motor_names order
         self._smoothed_positions = None
 
-    @property
+    @cached_property
     def _motors_ft(self) -> dict[str, type]:
         """Feature types for motor positions"""
-        return {f"{motor}.pos": float for motor in self.bus.motors}
+        return dict.fromkeys(self._motor_keys, float)
 
     @property
     def _cameras_ft(self) -> dict[str, tuple]:
@@ -165,6 +174,7 @@ class KikobotLeader(Robot):
         
         # Connect to motor bus
         self.bus.connect()
+        self._set_low_latency()
         
         # Run calibration if needed
         if not self.is_calibrated and calibrate:
@@ -177,12 +187,29 @@ class KikobotLeader(Robot):
         # Connect cameras (if any)
         for cam in self.cameras.values():
             cam.connect()
+        if self.cameras:
+            self._cam_pool = ThreadPoolExecutor(
+                max_workers=len(self.cameras), thread_name_prefix=f"{self.name}_cam"
+            )
         
         # Configure motors
         self.configure()
         
         logger.info(f"{self.name} connected successfully.")
 
+    def _set_low_latency(self) -> None:
+        """
+        Enable ASYNC_LOW_LATENCY on the bus serial port.
+        
+        USB-serial drivers otherwise hold received bytes for up to 16 ms,
+        which delays every Present_Position reply from the servos.
+        """
+        try:
+            self.bus.port_handler.ser.set_low_latency_mode(True)
+            logger.info(f"Low-latency mode enabled on {self.config.port}")
+        except (AttributeError, NotImplementedError, OSError, ValueError) as e:
+            logger.warning(f"Could not enable low-latency mode on {self.config.port}: {e}")
+
     @property
     def is_calibrated(self) -> bool:
         """Check if motors are calibrated"""
@@ -344,7 +371,11 @@ class KikobotLeader(Robot):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self.name} is not connected.")
 
-        obs_dict = {}
+        # Start camera captures first so they run while the serial bus is read
+        futures = {
+            cam_key: self._cam_pool.submit(cam.async_read)
+            for cam_key, cam in self.cameras.items()
+        }
         
         # Read arm position from all motors
         start = time.perf_counter()
@@ -352,29 +383,33 @@ class KikobotLeader(Robot):
         
         # Apply position smoothing if configured
         if self.config.position_smoothing_alpha > 0:
+            new = np.fromiter(
+                (positions[motor] for motor in self._motor_names),
+                dtype=float,
+                count=len(self._motor_names),
+            )
             if self._smoothed_positions is None:
                 # Initialize smoothed positions on first read
-                self._smoothed_positions = positions.copy()
+                self._smoothed_positions = new
             else:
                 # Exponential moving average: smoothed = alpha * new + (1-alpha) * old
                 alpha = self.config.position_smoothing_alpha
-                for motor, pos in positions.items():
-                    self._smoothed_positions[motor] = (
-                        alpha * pos + (1 - alpha) * self._smoothed_positions[motor]
-                    )
+                self._smoothed_positions *= 1 - alpha
+                self._smoothed_positions += alpha * new
             
-            positions = self._smoothed_positions
+            obs_dict = dict(zip(self._motor_keys, self._smoothed_positions.tolist()))
+        else:
+            obs_dict = dict(zip(self._motor_keys, (positions[motor] for motor in self._motor_names)))
         
-        obs_dict = {f"{motor}.pos": val for motor, val in positions.items()}
         dt_ms = (time.perf_counter() - start) * 1000
         logger.debug(f"{self.name} read state: {dt_ms:.1f}ms")
 
-        # Capture images from cameras (rarely used for leader)
-        for cam_key, cam in self.cameras.items():
-            start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
+        # Collect camera images (rarely used for leader)
+        for cam_key, future in futures.items():
+            obs_dict[cam_key] = future.result()
+        if futures:
             dt_ms = (time.perf_counter() - start) * 1000
-            logger.debug(f"{self.name} read {cam_key}: {dt_ms:.1f}ms")
+            logger.debug(f"{self.name} read state + {len(futures)} cameras: {dt_ms:.1f}ms")
 
         return obs_dict
 
@@ -410,6 +445,9 @@ class KikobotLeader(Robot):
             return
 
         # Disconnect cameras
+        if self._cam_pool is not None:
+            self._cam_pool.shutdown(wait=True)
+            self._cam_pool = None
         for cam in self.cameras.values():
             cam.disconnect()
 
@@ -40,7 +40,9 @@ Controls:
 import argparse
 import logging
 import sys
+import threading
 import time
+from collections import namedtuple
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -69,6 +71,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# One recorded timestep (lighter than a dict per frame)
+Frame = namedtuple("Frame", ["timestamp", "observation", "action"])
+
 
 class KikobotDatasetRecorder:
     """
@@ -125,6 +130,12 @@ class KikobotDatasetRecorder:
         self.current_episode = []
         self.episode_index = 0
         
+        # Leader observation keys that form the action (set on first frame)
+        self._action_keys = None
+        
+        # Background episode saver (one at a time)
+        self._save_thread = None
+        
         # Dataset
         self.dataset = None
 
@@ -215,6 +226,10 @@ class KikobotDatasetRecorder:
             logger.warning("Already recording! Stop current episode first.")
             return
         
+        if self.is_saving():
+            logger.warning("Previous episode is still being saved. Try again shortly.")
+            return
+        
         self.current_episode = []
         self.is_recording = True
         
@@ -228,6 +243,10 @@ class KikobotDatasetRecorder:
         """
         Stop recording and optionally save the episode.
         
+        Saving runs on a background thread so the prompt stays responsive.
+        The recorded frames are handed off to the saver, so a new episode
+        can never clobber them mid-save.
+        
         Args:
             save: If True, save the episode to dataset
         """
@@ -242,49 +261,104 @@ class KikobotDatasetRecorder:
             self.current_episode = []
             return
         
+        frames = self.current_episode
+        self.current_episode = []
+        
+        self._save_thread = threading.Thread(
+            target=self._save_episode,
+            args=(frames, self.episode_index),
+            name=f"save-episode-{self.episode_index}",
+        )
+        self._save_thread.start()
+
+    def is_saving(self) -> bool:
+        """Check if an episode is still being saved in the background."""
+        return self._save_thread is not None and self._save_thread.is_alive()
+
+    def wait_for_save(self) -> None:
+        """Block until the background episode save (if any) has finished."""
+        if self._save_thread is not None:
+            self._save_thread.join()
+            self._save_thread = None
+
+    def _save_episode(self, frames: list, episode_index: int) -> None:
+        """
+        Convert recorded frames to LeRobot format and save them.
+        
+        Runs on the background saver thread.
+        
+        Args:
+            frames: Recorded frames of the episode
+            episode_index: Index of the episode in the dataset
+        """
         logger.info(f"\n{'='*60}")
-        logger.info(f"⏹ Saving Episode {self.episode_index}")
+        logger.info(f"⏹ Saving Episode {episode_index}")
         logger.info(f"{'='*60}")
-        logger.info(f"  Frames: {len(self.current_episode)}")
-        logger.info(f"  Duration: {len(self.current_episode) / self.frequency:.2f} seconds")
+        logger.info(f"  Frames: {len(frames)}")
+        logger.info(f"  Duration: {len(frames) / self.frequency:.2f} seconds")
         
         try:
             # Convert episode data to LeRobot format
             episode_data = {
                 "observation": {},
                 "action": {},
-                "episode_index": np.full(len(self.current_episode), self.episode_index),
-                "frame_index": np.arange(len(self.current_episode)),
-                "timestamp": np.array([frame["timestamp"] for frame in self.current_episode]),
+                "episode_index": np.full(len(frames), episode_index),
+                "frame_index": np.arange(len(frames)),
+                "timestamp": np.array([frame.timestamp for frame in frames]),
             }
             
             # Extract observations and actions
-            for key in self.current_episode[0]["observation"].keys():
-                episode_data["observation"][key] = np.array([
-                    frame["observation"][key] for frame in self.current_episode
-                ])
-            
-            for key in self.current_episode[0]["action"].keys():
-                episode_data["action"][key] = np.array([
-                    frame["action"][key] for frame in self.current_episode
-                ])
+            episode_data["observation"] = self._stack_records(
+                [frame.observation for frame in frames]
+            )
+            episode_data["action"] = self._stack_records(
+                [frame.action for frame in frames]
+            )
             
             # Add to dataset
             save_episode(
                 episode_data,
-                episode_index=self.episode_index,
+                episode_index=episode_index,
                 dataset=self.dataset,
             )
             
-            logger.info(f"✓ Episode {self.episode_index} saved successfully!")
+            logger.info(f"✓ Episode {episode_index} saved successfully!")
             logger.info(f"{'='*60}\n")
             
-            self.episode_index += 1
-            self.current_episode = []
+            self.episode_index = episode_index + 1
             
         except Exception as e:
             logger.error(f"Failed to save episode: {e}")
-            self.current_episode = []
+
+    @staticmethod
+    def _stack_records(records: list[dict]) -> dict:
+        """
+        Stack per-frame records into per-key arrays.
+        
+        All joint positions ('.pos' keys) are gathered into a single
+        (N, n_joints) float32 array in one pass; each key is a column view
+        of it. Any other entries (e.g. camera images) are stacked per key.
+        
+        Args:
+            records: Per-frame dicts with identical keys
+        
+        Returns:
+            Dictionary mapping each key to an array with one row per frame
+        """
+        keys = list(records[0].keys())
+        joint_keys = [key for key in keys if key.endswith('.pos')]
+        
+        joints = np.array(
+            [[record[key] for key in joint_keys] for record in records],
+            dtype=np.float32,
+        )
+        stacked = {key: joints[:, j] for j, key in enumerate(joint_keys)}
+        
+        for key in keys:
+            if key not in stacked:
+                stacked[key] = np.array([record[key] for record in records])
+        
+        return stacked
 
     def record_frame(self) -> None:
         """Record a single frame of data."""
@@ -294,27 +368,23 @@ class KikobotDatasetRecorder:
             
             # Read leader arm position (this becomes the action)
             leader_obs = self.leader.get_observation()
-            action = {
-                key: value for key, value in leader_obs.items()
-                if key.endswith('.pos')
-            }
             
-            # Read follower arm observation
-            follower_obs = self.follower.get_observation()
-            observation = {
-                key: value for key, value in follower_obs.items()
-            }
+            # The observation layout is fixed once connected, so resolve the
+            # action keys on the first frame and reuse them afterwards
+            if self._action_keys is None:
+                self._action_keys = tuple(
+                    key for key in leader_obs if key.endswith('.pos')
+                )
+            action = {key: leader_obs[key] for key in self._action_keys}
+            
+            # Read follower arm observation (already a fresh dict per call)
+            observation = self.follower.get_observation()
             
             # Send action to follower (mirror leader)
             self.follower.send_action(action)
             
             # Store frame
-            frame = {
-                "timestamp": timestamp,
-                "observation": observation,
-                "action": action,
-            }
-            self.current_episode.append(frame)
+            self.current_episode.append(Frame(timestamp, observation, action))
             
         except Exception as e:
             logger.error(f"Error recording frame: {e}")
@@ -373,6 +443,9 @@ class KikobotDatasetRecorder:
                 logger.info("\nStopping current episode...")
                 user_input = input("Save episode? (y/n): ").strip().lower()
                 self.stop_episode(save=(user_input == 'y'))
+            
+            # Don't drop an episode that is still being written
+            self.wait_for_save()
 
     def _record_until_stopped(self) -> None:
         """Record frames until user stops."""
@@ -5,25 +5,40 @@ Low-level interface to control KikoBot C1 via Waveshare servo adapter
 Wraps the servo protocol for easy position/velocity control
 """
 
+import os
 import serial
 import struct
 import time
 import numpy as np
+from collections import namedtuple
 from servo_limits_config import SERVO_CONFIG, degrees_to_steps, steps_to_degrees
 
 # SMS/STS Protocol Commands
 INST_PING = 1
 INST_READ = 2
 INST_WRITE = 3
+INST_REG_WRITE = 4
+INST_ACTION = 5
+INST_SYNC_READ = 130
 INST_SYNC_WRITE = 131
 
+# Broadcast ID (addresses every servo on the bus, no status reply)
+BROADCAST_ID = 254
+
 # Memory addresses
+SMS_STS_RETURN_DELAY = 7
+SMS_STS_STATUS_RETURN_LEVEL = 8
+SMS_STS_LOCK = 55
 SMS_STS_GOAL_POSITION_L = 42
 SMS_STS_GOAL_SPEED_L = 46
 SMS_STS_GOAL_ACC = 41
 SMS_STS_PRESENT_POSITION_L = 56
+SMS_STS_MOVING = 66
 SMS_STS_TORQUE_ENABLE = 40
 
+# Status packet returned by a servo (params is the raw register bytes)
+StatusPacket = namedtuple('StatusPacket', ['id', 'error', 'params'])
+
 class RobotController:
     """
     High-level interface for KikoBot C1 control
@@ -51,6 +66,11 @@ class RobotController:
         self.max_position_change = 500  # Maximum steps change per command (safety)
         self.min_move_threshold = 10   # Minimum steps to trigger movement
         
+        # Reusable TX buffer so packet writes don't allocate per call
+        self._tx = bytearray(256)
+        self._tx_view = memoryview(self._tx)
+        self._tx_array = np.frombuffer(self._tx, dtype=np.uint8)
+        
     def connect(self):
         """Connect to servo adapter"""
         try:
@@ -59,11 +79,10 @@ class RobotController:
             self.connected = True
             print(f"✓ Connected to robot on {self.port}")
             
+            self.set_low_latency()
+            
             # Ping all servos
-            online = []
-            for servo_id, name, _, _, _ in self.servo_config:
-                if self.ping(servo_id):
-                    online.append(servo_id)
+            online = self.scan([config[0] for config in self.servo_config])
             
             print(f"✓ Found {len(online)}/{self.num_servos} servos online: {online}")
             return True
@@ -73,6 +92,27 @@ class RobotController:
             self.connected = False
             return False
     
+    def set_low_latency(self):
+        """
+        Set the USB-serial latency timer to 1 ms
+        
+        FTDI-style adapters buffer incoming bytes for up to 16 ms by default,
+        which delays every short status packet from the servos. Adapters
+        without a latency timer (e.g. CDC-ACM) are left untouched.
+        """
+        tty_name = os.path.basename(os.path.realpath(self.port))
+        latency_path = f"/sys/bus/usb-serial/devices/{tty_name}/latency_timer"
+        if not os.path.exists(latency_path):
+            return
+        
+        try:
+            with open(latency_path, 'w') as f:
+                f.write('1')
+            print(f"✓ USB latency timer set to 1 ms for {tty_name}")
+        except OSError as e:
+            print(f"⚠ Warning: Could not set USB latency timer: {e}")
+            print(f"  Try: sudo setserial {self.port} low_latency")
+    
     def disconnect(self):
         """Disconnect from servo adapter"""
         if self.ser and self.ser.is_open:
@@ -89,41 +129,56 @@ class RobotController:
         if not self.connected:
             return False
             
-        length = len(params) + 2
-        packet = [0xFF, 0xFF, servo_id, length, instruction] + params
-        checksum = self.calculate_checksum(packet[2:])
-        packet.append(checksum)
+        n = len(params) + 6
+        if n > len(self._tx):
+            print(f"Write error: packet too long ({n} bytes)")
+            return False
         
+        struct.pack_into('<5B', self._tx, 0, 0xFF, 0xFF, servo_id, len(params) + 2, instruction)
+        self._tx[5:n - 1] = params
+        self._tx[n - 1] = self.calculate_checksum(self._tx_view[2:n - 1])
+        
+        return self._send(n)
+    
+    def _send(self, n):
+        """Write the first n bytes of the TX buffer to the bus"""
         try:
-            self.ser.write(bytes(packet))
+            self.ser.write(self._tx_view[:n])
             return True
         except Exception as e:
             print(f"Write error: {e}")
             return False
     
-    def read_packet(self):
-        """Read response packet from servo"""
+    def read_packet(self, timeout=0.1):
+        """
+        Read response packet from servo
+        
+        Args:
+            timeout: Seconds to wait for a reply
+        """
         if not self.connected:
             return None
             
+        # Bind to locals: this loop spins until the reply arrives
+        ser = self.ser
+        clock = time.time
+        
         try:
             # Look for header
-            timeout = time.time() + 0.1
-            while time.time() < timeout:
-                if self.ser.in_waiting > 0:
-                    if self.ser.read(1)[0] == 0xFF:
-                        if self.ser.read(1)[0] == 0xFF:
-                            # Got header, read rest
-                            servo_id = self.ser.read(1)[0]
-                            length = self.ser.read(1)[0]
-                            error = self.ser.read(1)[0]
+            deadline = clock() + timeout
+            while clock() < deadline:
+                if ser.in_waiting > 0:
+                    if ser.read(1)[0] == 0xFF:
+                        if ser.read(1)[0] == 0xFF:
+                            # Got header: id, length and error in one read
+                            servo_id, length, error = ser.read(3)
                             
-                            params = []
-                            for _ in range(length - 2):
-                                params.append(self.ser.read(1)[0])
+                            # Params and checksum in one read
+                            body = ser.read(length - 1)
+                            if len(body) < length - 1:
+                                return None
                             
-                            checksum = self.ser.read(1)[0]
-                            return {'id': servo_id, 'error': error, 'params': params}
+                            return StatusPacket(servo_id, error, body[:-1])
             return None
         except Exception as e:
             print(f"Read error: {e}")
@@ -137,15 +192,120 @@ class RobotController:
             return response is not None
         return False
     
-    def write_position(self, servo_id, position, speed=None, acc=None):
+    def scan(self, servo_ids, timeout=0.02):
         """
-        Write goal position to a single servo
+        Find which servos are present on the bus
+        
+        A broadcast ping can't be used with several servos on the bus (their
+        replies collide), so each ID is pinged in turn with a short timeout
+        instead of the full read timeout. The timeout must stay above the
+        USB adapter's latency timer (16 ms by default when set_low_latency()
+        could not lower it), otherwise replies arrive after the wait.
         
         Args:
-            servo_id: Servo ID (1-7)
-            position: Target position in steps (0-4095)
-            speed: Movement speed in steps/sec (default: self.default_speed)
-            acc: Acceleration (default: self.default_acc)
+            servo_ids: IDs to probe
+            timeout: Seconds to wait for each reply
+        
+        Returns:
+            List of IDs that answered
+        """
+        online = []
+        for servo_id in servo_ids:
+            # Drop any late reply to the previous ping so it isn't credited here
+            self.ser.reset_input_buffer()
+            if not self.write_packet(servo_id, INST_PING, []):
+                break
+            response = self.read_packet(timeout=timeout)
+            if response is not None and response.id == servo_id:
+                online.append(servo_id)
+        return online
+    
+    def read_register(self, servo_id, address):
+        """
+        Read a single-byte register from a servo
+        
+        Returns:
+            Register value, or None if read failed
+        """
+        if self.write_packet(servo_id, INST_READ, [address, 1]):
+            response = self.read_packet()
+            # Skip leftover (empty) replies to earlier writes
+            while response is not None and (response.id != servo_id or len(response.params) < 1):
+                response = self.read_packet()
+            if response is not None:
+                return response.params[0]
+        return None
+    
+    def write_eeprom(self, servo_id, address, value):
+        """
+        Write a single byte to an EEPROM register (unlock, write, relock)
+        
+        Args:
+            servo_id: Servo ID
+            address: EEPROM register address
+            value: Byte value to write
+        """
+        ok = self.write_packet(servo_id, INST_WRITE, [SMS_STS_LOCK, 0])
+        ok = self.write_packet(servo_id, INST_WRITE, [address, value]) and ok
+        ok = self.write_packet(servo_id, INST_WRITE, [SMS_STS_LOCK, 1]) and ok
+        return ok
+    
+    def set_status_return_level(self, servo_ids, level):
+        """
+        Set Status Return Level (EEPROM register 8) on several servos
+        
+        Level 0 makes a servo answer only READ and PING; level 1 (factory
+        default) makes it answer every instruction. The current level is read
+        first and only servos that differ (or can't be read) are written, to
+        spare the EEPROM. Each servo is pinged afterwards to check it still
+        responds.
+        
+        Args:
+            servo_ids: Servo IDs to configure
+            level: 0 (reads/pings only) or 1 (all instructions)
+        
+        Returns:
+            List of IDs that answered the check ping
+        """
+        changed = [servo_id for servo_id in servo_ids
+                   if self.read_register(servo_id, SMS_STS_STATUS_RETURN_LEVEL) != level]
+        for servo_id in changed:
+            self.write_eeprom(servo_id, SMS_STS_STATUS_RETURN_LEVEL, level)
+        
+        if changed:
+            # Drop the replies the servos sent before the new level took effect
+            time.sleep(0.01)
+            self.ser.reset_input_buffer()
+        return self.scan(servo_ids)
+    
+    def set_reply_to_reads_only(self, servo_ids):
+        """
+        Stop servos from sending a status packet after every write
+        
+        With Status Return Level 0 the servos only answer READ and PING, so
+        writes no longer hold the bus for a reply nobody reads. This is an
+        opt-in for callers that never wait for write replies (e.g.
+        examples/leader_follower.py); connect() does not do it.
+        
+        The level is stored in EEPROM and survives power cycles. Tools that
+        wait for a reply to every write, such as the LeRobot Kikobot robots
+        (FeetechMotorsBus.write), time out on these servos until level 1 is
+        restored with set_status_return_level(servo_ids, 1).
+        
+        Args:
+            servo_ids: Servo IDs to configure
+        
+        Returns:
+            List of IDs that answered the check ping
+        """
+        return self.set_status_return_level(servo_ids, 0)
+    
+    def _position_params(self, position, speed=None, acc=None):
+        """
+        Build the goal register block starting at SMS_STS_GOAL_ACC
+        
+        Returns:
+            [acc, position_low, position_high, 0, 0, speed_low, speed_high]
         """
         if speed is None:
             speed = self.default_speed
@@ -157,8 +317,7 @@ class RobotController:
         speed = int(max(0, min(2400, speed)))
         acc = int(max(0, min(254, acc)))
         
-        # Build parameter list: [acc, position_low, position_high, 0, 0, speed_low, speed_high]
-        params = [
+        return [
             acc,
             position & 0xFF,
             (position >> 8) & 0xFF,
@@ -167,9 +326,99 @@ class RobotController:
             speed & 0xFF,
             (speed >> 8) & 0xFF
         ]
+    
+    def write_position(self, servo_id, position, speed=None, acc=None):
+        """
+        Write goal position to a single servo
         
+        Args:
+            servo_id: Servo ID (1-7)
+            position: Target position in steps (0-4095)
+            speed: Movement speed in steps/sec (default: self.default_speed)
+            acc: Acceleration (default: self.default_acc)
+        """
+        params = self._position_params(position, speed, acc)
         return self.write_packet(servo_id, INST_WRITE, [SMS_STS_GOAL_ACC] + params)
     
+    def reg_write_position(self, servo_id, position, speed=None, acc=None):
+        """
+        Stage a goal position with REG WRITE (executed on the next ACTION)
+        
+        Args:
+            servo_id: Servo ID
+            position: Target position in steps (0-4095)
+            speed: Movement speed in steps/sec (default: self.default_speed)
+            acc: Acceleration (default: self.default_acc)
+        """
+        params = self._position_params(position, speed, acc)
+        return self.write_packet(servo_id, INST_REG_WRITE, [SMS_STS_GOAL_ACC] + params)
+    
+    def action(self):
+        """Broadcast ACTION so every servo executes its staged REG WRITE at once"""
+        return self.write_packet(BROADCAST_ID, INST_ACTION, [])
+    
+    def sync_write(self, servo_ids, address, data):
+        """
+        Write a register block to several servos with one SYNC WRITE packet
+        
+        The packet is broadcast, so no status replies are generated.
+        
+        Args:
+            servo_ids: List of servo IDs
+            address: Start register address
+            data: List of byte lists, one per servo (all the same length)
+        """
+        params = [address, len(data[0])]
+        for servo_id, servo_data in zip(servo_ids, data):
+            params.append(servo_id)
+            params.extend(servo_data)
+        
+        return self.write_packet(BROADCAST_ID, INST_SYNC_WRITE, params)
+    
+    def sync_write_positions(self, servo_ids, positions, speed=None, acc=None):
+        """
+        Write goal positions to several servos with one SYNC WRITE packet
+        
+        The whole packet (header, per-servo goal blocks, checksum) is packed
+        with array operations instead of building per-servo byte lists.
+        
+        Args:
+            servo_ids: List of servo IDs
+            positions: Target positions in steps (0-4095), one per servo
+            speed: Movement speed in steps/sec (default: self.default_speed)
+            acc: Acceleration (default: self.default_acc)
+        """
+        if not self.connected:
+            return False
+        
+        if speed is None:
+            speed = self.default_speed
+        if acc is None:
+            acc = self.default_acc
+        speed = int(max(0, min(2400, speed)))
+        acc = int(max(0, min(254, acc)))
+        positions = np.clip(np.asarray(positions, dtype=np.int64), 0, 4095)
+        
+        # FF FF FE LEN 0x83 addr 7 | id acc pos_l pos_h 0 0 speed_l speed_h | ... | checksum
+        n = len(servo_ids)
+        size = 8 * n + 8
+        if size > len(self._tx):
+            print(f"Write error: packet too long ({size} bytes)")
+            return False
+        packet = self._tx_array[:size]
+        packet[:7] = (0xFF, 0xFF, BROADCAST_ID, 8 * n + 4, INST_SYNC_WRITE, SMS_STS_GOAL_ACC, 7)
+        blocks = packet[7:-1].reshape(n, 8)
+        blocks[:, 0] = servo_ids
+        blocks[:, 1] = acc
+        blocks[:, 2] = positions & 0xFF
+        blocks[:, 3] = positions >> 8
+        blocks[:, 4:6] = 0
+        blocks[:, 6] = speed & 0xFF
+        blocks[:, 7] = speed >> 8
+        packet[-1] = ~int(packet[2:-1].sum()) & 0xFF
+        
+        return self._send(size)
+    
     def read_position(self, servo_id):
         """
         Read current position from a servo
@@ -180,11 +429,85 @@ class RobotController:
         if self.write_packet(servo_id, INST_READ, [SMS_STS_PRESENT_POSITION_L, 2]):
             time.sleep(0.01)
             response = self.read_packet()
-            if response and len(response['params']) >= 2:
-                position = response['params'][0] | (response['params'][1] << 8)
+            # Skip leftover (empty) replies to earlier writes
+            while response is not None and (response.id != servo_id or len(response.params) < 2):
+                response = self.read_packet()
+            if response is not None:
+                position = response.params[0] | (response.params[1] << 8)
                 return position
         return None
     
+    def sync_read(self, servo_ids, address, length):
+        """
+        Read a register block from several servos with one SYNC READ packet
+        
+        Args:
+            servo_ids: List of servo IDs
+            address: Start register address
+            length: Number of bytes to read from each servo
+        
+        Returns:
+            Dict mapping servo ID to its register bytes, or None if any servo
+            failed to reply
+        """
+        servo_ids = list(servo_ids)
+        if not self.write_packet(BROADCAST_ID, INST_SYNC_READ, [address, length] + servo_ids):
+            return None
+        
+        # Each servo answers with its own status packet, in ID order. Leftover
+        # (empty) replies to earlier writes are skipped.
+        data = {}
+        while len(data) < len(servo_ids):
+            response = self.read_packet()
+            if response is None:
+                return None
+            if response.id in servo_ids and len(response.params) >= length:
+                data[response.id] = response.params[:length]
+        return data
+    
+    def sync_read_positions(self, servo_ids):
+        """
+        Read current positions from several servos with one SYNC READ packet
+        
+        Returns:
+            List of positions in steps (same order as servo_ids), or None if read failed
+        """
+        data = self.sync_read(servo_ids, SMS_STS_PRESENT_POSITION_L, 2)
+        if data is None:
+            return None
+        return [data[servo_id][0] | (data[servo_id][1] << 8) for servo_id in servo_ids]
+    
+    def wait_until_stopped(self, servo_ids=None, poll_dt=0.005, timeout=0.5):
+        """
+        Block until every servo reports that it has finished moving
+        
+        Polls the Moving flag with SYNC READ instead of sleeping for a fixed
+        time. If the flag can't be read, falls back to a short fixed sleep.
+        
+        Args:
+            servo_ids: Servo IDs to wait for (default: all configured servos)
+            poll_dt: Seconds between polls
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            True if all servos stopped, False on timeout or read failure
+        """
+        if servo_ids is None:
+            servo_ids = [config[0] for config in self.servo_config]
+        
+        deadline = time.perf_counter() + timeout
+        while True:
+            # Give the servos a moment to latch the new goal before the first poll
+            time.sleep(poll_dt)
+            data = self.sync_read(servo_ids, SMS_STS_MOVING, 1)
+            if data is None:
+                time.sleep(0.05)
+                return False
+            if not any(data[servo_id][0] for servo_id in servo_ids):
+                return True
+            if time.perf_counter() >= deadline:
+                return False
+    
     def get_joint_positions_degrees(self, retries=3):
         """
         Read all joint positions in degrees with retry logic
@@ -297,11 +620,13 @@ class RobotController:
             
             target_steps.append(steps)
         
-        # Send commands to all servos
+        # Stage every joint's goal, then start them together with one ACTION
         success = True
         for i, (servo_id, _, _, _, _) in enumerate(self.servo_config):
-            if not self.write_position(servo_id, target_steps[i], speed, acc):
+            if not self.reg_write_position(servo_id, target_steps[i], speed, acc):
                 success = False
+        if success:
+            success = self.action()
         
         # Update current positions if successful
         if success:
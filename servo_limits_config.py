@@ -3,6 +3,10 @@ Servo Limits Configuration
 Based on HomeAll.cpp - tested and verified limits
 """
 
+# Step/degree conversion factors (0-4095 steps = 0-360 degrees), folded once
+STEPS_PER_DEGREE = 4096.0 / 360.0
+DEGREES_PER_STEP = 360.0 / 4096.0
+
 def degrees_to_steps(deg):
     """
     Convert degrees to servo steps
@@ -15,7 +19,7 @@ def degrees_to_steps(deg):
         normalized += 360.0
     
     # Convert to steps
-    steps = int(round((normalized / 360.0) * 4096.0))
+    steps = int(round(normalized * STEPS_PER_DEGREE))
     
     # Clamp to valid range
     if steps >= 4096:
@@ -29,7 +33,7 @@ def steps_to_degrees(steps):
     Returns angle in -180 to +180 range
     """
     # Convert steps to 0-360 range
-    angle = (steps / 4096.0) * 360.0
+    angle = steps * DEGREES_PER_STEP
     
     # Convert to -180 to +180 range (centered at 0°)
     if angle > 180.0: